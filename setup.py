@@ -27,6 +27,11 @@ test_requirements = [
     'pytest'
 ]
 
+extras_requirements = {
+    'async': ['aiohttp'],
+    'speedups': ['orjson'],
+}
+
 # If username is in the version file, append it to the package name
 if '__username__' in about:
     name = f'{about["__title__"]}-{about["__username__"]}'
@@ -46,6 +51,7 @@ setup(
     include_package_data=True,
     python_requires='>= 3.6',
     install_requires=requires,
+    extras_require=extras_requirements,
     tests_require=test_requirements,
     license=about['__license__'],
     classifiers=[
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Test fixtures: a local HTTP server that stubs the 2ip API
+"""
+
+import importlib
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from twoip import TwoIP
+
+
+class StubAPIHandler(BaseHTTPRequestHandler):
+    """Serve /<type>.<format> lookups like the 2ip API."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        stub = self.server.stub
+        with stub.lock:
+            stub.requests.append(self.path)
+            stub.clients.append(self.client_address)
+            response = stub.responses.pop(0) if stub.responses else None
+
+        # Optionally slow down responses so concurrent lookups overlap
+        if stub.delay:
+            time.sleep(stub.delay)
+
+        # Queued error response (status code and headers)
+        if response:
+            status, headers = response
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        type, format = url.path.strip('/').split('.')
+        if format == 'json':
+            body = json.dumps({'ip': query['ip'][0], 'type': type, 'key': query.get('key', [None])[0]}).encode()
+        else:
+            body = f'<?xml version="1.0" encoding="UTF-8"?>\n<{type}_api><ip>{query["ip"][0]}</ip></{type}_api>'.encode()
+
+        self.send_response(200)
+        self.send_header('Content-Type', f'application/{format}')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StubAPI(object):
+    """State shared between the tests and the stub API server."""
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.lock = threading.Lock()
+        self.requests = []
+        self.clients = []
+        self.responses = []
+        self.delay = 0
+
+    def queue(self, status: int, count: int = 1, **headers) -> None:
+        """Queue error responses to be returned before any successful lookups."""
+        self.responses.extend([(status, headers)] * count)
+
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubAPIHandler)
+    server.daemon_threads = True
+    server.stub = StubAPI(url = f'http://127.0.0.1:{server.server_address[1]}')
+    thread = threading.Thread(target = server.serve_forever, daemon = True)
+    thread.start()
+    yield server.stub
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(stub):
+    """TwoIP subclass that sends requests to the stub API."""
+
+    class StubTwoIP(TwoIP):
+        api = stub.url
+
+    return StubTwoIP
+
+
+@pytest.fixture(params = ['orjson', 'json'])
+def json_module(request, monkeypatch):
+    """Parse json responses with orjson, or with the standard library json module if orjson is not installed."""
+    module = importlib.import_module('twoip.twoip')
+    if request.param == 'orjson':
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setitem(sys.modules, 'orjson', None)
+        importlib.reload(module)
+    yield request.param
+
+    # Restore the json parser picked on first import
+    monkeypatch.undo()
+    importlib.reload(module)
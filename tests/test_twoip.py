@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from twoip import twoip as twoip_module
+from twoip import TwoIP
+
+
+# Retries
+
+def test_retry_rate_limit(stub, client):
+    stub.queue(429, count = 2)
+    twoip = client(base_delay = 0.01)
+    assert twoip.geo(ip = '192.0.2.1')['ip'] == '192.0.2.1'
+    assert len(stub.requests) == 3
+
+
+def test_retry_server_error(stub, client):
+    stub.queue(503)
+    twoip = client(base_delay = 0.01)
+    assert twoip.provider(ip = '192.0.2.1')['type'] == 'provider'
+    assert len(stub.requests) == 2
+
+
+def test_retry_exhausted(stub, client):
+    stub.queue(429, count = 3)
+    twoip = client(max_retries = 2, base_delay = 0.01)
+    with pytest.raises(RuntimeError) as e:
+        twoip.geo(ip = '192.0.2.1')
+    assert 'rate limit' in str(e.value.__cause__)
+    assert len(stub.requests) == 3
+
+
+def test_no_retry_client_error(stub, client):
+    stub.queue(404)
+    with pytest.raises(RuntimeError):
+        client(base_delay = 0.01).geo(ip = '192.0.2.1')
+    assert len(stub.requests) == 1
+
+
+def test_retry_after(stub, client):
+    stub.queue(429, **{'Retry-After': '0.3'})
+    twoip = client(base_delay = 0)
+    start = time.monotonic()
+    twoip.geo(ip = '192.0.2.1')
+    assert time.monotonic() - start >= 0.3
+    assert len(stub.requests) == 2
+
+
+def test_retry_after_capped(stub, client):
+    stub.queue(429, **{'Retry-After': '3600'})
+    twoip = client(max_delay = 0.1)
+    start = time.monotonic()
+    twoip.geo(ip = '192.0.2.1')
+    assert time.monotonic() - start < 1
+
+
+@pytest.mark.parametrize('params', [{'max_retries': -1}, {'base_delay': -1}, {'max_delay': -1}, {'jitter': -0.5}])
+def test_retry_invalid(client, params):
+    with pytest.raises(ValueError):
+        client(**params)
+
+
+# Cache
+
+def test_cache_hit(stub, client):
+    twoip = client()
+    assert twoip.geo(ip = '192.0.2.1') == twoip.geo(ip = '192.0.2.1')
+    assert len(stub.requests) == 1
+
+    # Cache entries are per lookup type and format
+    twoip.provider(ip = '192.0.2.1')
+    assert twoip.geo(ip = '192.0.2.1', format = 'xml').startswith('<?xml')
+    assert len(stub.requests) == 3
+
+
+def test_cache_force(stub, client):
+    twoip = client()
+    twoip.geo(ip = '192.0.2.1')
+    twoip.geo(ip = '192.0.2.1', force = True)
+    assert len(stub.requests) == 2
+
+
+def test_cache_disabled_per_lookup(stub, client):
+    twoip = client()
+    twoip.geo(ip = '192.0.2.1', cache = False)
+    twoip.geo(ip = '192.0.2.1')
+    assert len(stub.requests) == 2
+
+
+def test_cache_ttl(stub, client):
+    twoip = client(cache_ttl = 1)
+    twoip.geo(ip = '192.0.2.1')
+    twoip.geo(ip = '192.0.2.1')
+    assert len(stub.requests) == 1
+    time.sleep(1.1)
+    twoip.geo(ip = '192.0.2.1')
+    assert len(stub.requests) == 2
+
+
+def test_cache_maxsize(stub, client):
+    twoip = client(cache_maxsize = 1)
+    twoip.geo(ip = '192.0.2.1')
+    twoip.geo(ip = '192.0.2.2')
+    twoip.geo(ip = '192.0.2.1')
+    assert len(stub.requests) == 3
+
+
+def test_cache_maxsize_disabled(stub, client):
+    twoip = client(cache_maxsize = 0)
+    assert twoip.geo(ip = '192.0.2.1')['ip'] == '192.0.2.1'
+    twoip.geo(ip = '192.0.2.1')
+    assert len(stub.requests) == 2
+
+
+@pytest.mark.parametrize('params', [{'cache_ttl': -1}, {'cache_maxsize': -1}])
+def test_cache_invalid(client, params):
+    with pytest.raises(ValueError):
+        client(**params)
+
+
+# Validation
+
+@pytest.mark.parametrize('ip', ['invalid', '192.0.2.1\x00', '', None, ['192.0.2.1'], {}])
+def test_invalid_ip(stub, client, ip):
+    with pytest.raises(ValueError):
+        client().geo(ip = ip)
+    assert stub.requests == []
+
+
+def test_invalid_format(stub, client):
+    with pytest.raises(ValueError):
+        client().geo(ip = '192.0.2.1', format = 'csv')
+    assert stub.requests == []
+
+
+# Responses
+
+@pytest.mark.parametrize('content, encoding', [(b'\xff', 'utf-8'), (b'<xml/>', 'unknown-charset')])
+def test_invalid_xml_response(content, encoding):
+    with pytest.raises(RuntimeError):
+        TwoIP()._TwoIP__parse_response(content = content, content_type = 'application/xml', encoding = encoding, format = 'xml')
+
+
+def test_json_response(stub, client, json_module):
+    result = client().geo(ip = '192.0.2.1')
+    assert result == {'ip': '192.0.2.1', 'type': 'geo', 'key': None}
+    assert twoip_module.json_loads.__module__.split('.')[0] == json_module
+
+
+@pytest.mark.parametrize('content', [b'{"ip": ', b'\xff'])
+def test_invalid_json_response(json_module, content):
+    with pytest.raises(RuntimeError):
+        TwoIP()._TwoIP__parse_response(content = content, content_type = 'application/json', encoding = None, format = 'json')
+
+
+# API URL
+
+def test_api_changed(stub, client):
+    twoip = client()
+    client.api = 'http://127.0.0.1:1'
+    with pytest.raises(RuntimeError):
+        twoip.geo(ip = '192.0.2.1')
+    client.api = stub.url
+    assert twoip.geo(ip = '192.0.2.1')['ip'] == '192.0.2.1'
+    assert TwoIP.api == 'https://api.2ip.me'
+
+
+def test_api_changed_instance(stub, client):
+    twoip = client()
+    twoip.api = 'http://127.0.0.1:1'
+    with pytest.raises(RuntimeError):
+        twoip.geo(ip = '192.0.2.1')
+    assert client().geo(ip = '192.0.2.1')['ip'] == '192.0.2.1'
+
+
+# Client
+
+def test_session_reuse(stub, client):
+    twoip = client()
+    twoip.geo(ip = '192.0.2.1')
+    twoip.provider(ip = '192.0.2.1', force = True)
+    assert len(stub.clients) == 2
+    assert len(set(stub.clients)) == 1
+
+
+def test_close(stub, client):
+    twoip = client()
+    twoip.geo(ip = '192.0.2.1')
+    twoip.close()
+
+    # Closing releases the pooled connection, so the next request opens a new one
+    twoip.geo(ip = '192.0.2.1', force = True)
+    assert len(set(stub.clients)) == 2
+
+
+def test_context_manager(stub, client):
+    with client() as twoip:
+        twoip.geo(ip = '192.0.2.1')
+    twoip.geo(ip = '192.0.2.1', force = True)
+    assert len(set(stub.clients)) == 2
+
+
+def test_timeout(stub, client):
+    stub.delay = 0.5
+    twoip = client(timeout = 0.1)
+    start = time.monotonic()
+    with pytest.raises(RuntimeError):
+        twoip.geo(ip = '192.0.2.1')
+    assert time.monotonic() - start < 0.5
+    assert len(stub.requests) == 1
+
+
+def test_weakref(client):
+    twoip = client()
+    assert weakref.ref(twoip)() is twoip
+
+
+# Request coalescing
+
+def test_coalesce_concurrent_lookups(stub, client):
+    stub.delay = 0.3
+    twoip = client()
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(lambda i: twoip.geo(ip = f'192.0.2.{i % 2}', force = True), range(8)))
+    assert [result['ip'] for result in results] == [f'192.0.2.{i % 2}' for i in range(8)]
+    assert len(stub.requests) == 2
+
+
+def test_coalesce_exception(stub, client):
+    stub.delay = 0.3
+    stub.queue(429, count = 10)
+    twoip = client(max_retries = 0)
+
+    def lookup(i):
+        try:
+            twoip.geo(ip = '192.0.2.1')
+        except RuntimeError:
+            return 'error'
+
+    with ThreadPoolExecutor(4) as executor:
+        assert list(executor.map(lookup, range(4))) == ['error'] * 4
+    assert len(stub.requests) == 1
+
+    # The failed lookup is not left in flight
+    stub.responses.clear()
+    stub.delay = 0
+    assert twoip.geo(ip = '192.0.2.1')['ip'] == '192.0.2.1'
+
+
+def test_coalesce_interrupted(stub, client):
+    started = threading.Event()
+    release = threading.Event()
+
+    class Interrupted(BaseException):
+        pass
+
+    class InterruptedTwoIP(client):
+        def _TwoIP__execute_ip(self, ip, format, type):
+            started.set()
+            release.wait(5)
+            raise Interrupted()
+
+    twoip = InterruptedTwoIP()
+
+    def owner():
+        with pytest.raises(Interrupted):
+            twoip.geo(ip = '192.0.2.1')
+
+    with ThreadPoolExecutor(2) as executor:
+        first = executor.submit(owner)
+        assert started.wait(5)
+        waiter = executor.submit(twoip.geo, ip = '192.0.2.1')
+        time.sleep(0.1)
+        release.set()
+        first.result(5)
+        with pytest.raises(RuntimeError):
+            waiter.result(5)
+
+
+# Bulk lookups
+
+def test_geo_many(stub, client):
+    pytest.importorskip('aiohttp')
+    twoip = client(key = 'abc')
+    results = asyncio.run(twoip.geo_many(ips = ['192.0.2.2', '2001:db8::1', '192.0.2.1', '192.0.2.2']))
+    assert list(results) == ['192.0.2.2', '2001:db8::1', '192.0.2.1']
+    assert all(result['ip'] == ip and result['key'] == 'abc' for ip, result in results.items())
+    assert len(stub.requests) == 3
+
+
+def test_geo_many_cache(stub, client):
+    pytest.importorskip('aiohttp')
+    twoip = client()
+    twoip.geo(ip = '192.0.2.1')
+    results = asyncio.run(twoip.geo_many(ips = ['192.0.2.1', '192.0.2.2']))
+    assert list(results) == ['192.0.2.1', '192.0.2.2']
+    assert len(stub.requests) == 2
+
+    # Bulk lookup results are cached for later lookups
+    twoip.geo(ip = '192.0.2.2')
+    assert len(stub.requests) == 2
+
+
+def test_provider_many_retry(stub, client):
+    pytest.importorskip('aiohttp')
+    stub.queue(429, **{'Retry-After': '0'})
+    results = asyncio.run(client().provider_many(ips = ['192.0.2.1'], format = 'xml'))
+    assert '<ip>192.0.2.1</ip>' in results['192.0.2.1']
+    assert len(stub.requests) == 2
+
+
+def test_geo_many_invalid_ip(stub, client):
+    pytest.importorskip('aiohttp')
+    with pytest.raises(ValueError):
+        asyncio.run(client().geo_many(ips = ['192.0.2.1', 'invalid']))
+    assert stub.requests == []
+
+
+@pytest.mark.parametrize('ips', ['192.0.2.1', b'192.0.2.1'])
+def test_geo_many_single_string(stub, client, ips):
+    pytest.importorskip('aiohttp')
+    with pytest.raises(ValueError, match = 'not a single string'):
+        asyncio.run(client().geo_many(ips = ips))
+    assert stub.requests == []
+
+
+@pytest.mark.parametrize('ip', [None, ['192.0.2.1'], {}])
+def test_geo_many_non_string_ip(stub, client, ip):
+    pytest.importorskip('aiohttp')
+    with pytest.raises(ValueError):
+        asyncio.run(client().geo_many(ips = ['192.0.2.1', ip]))
+    assert stub.requests == []
@@ -1,17 +1,39 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import asyncio
 import logging
+import random
 import requests
-from ipaddress import ip_address
-from typing import Optional, Union
+import socket
+import threading
+import time
+from cachetools import TTLCache
+from concurrent.futures import Future
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+# aiohttp is optional and only required for the async bulk lookups
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Use orjson to parse json responses if available (falls back to the standard library json module)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Module logger
+logger = logging.getLogger(__name__)
 
 class TwoIP(object):
     """
     2ip.me API client
     """
 
-    # The API URL
+    # The API URL (may be overridden, e.g. to use a proxy)
     api = 'https://api.2ip.me'
 
     # List of available API endpoints
@@ -28,7 +50,8 @@ class TwoIP(object):
         },
     }
 
-    def __init__(self, key: Optional[str] = None) -> object:
+    def __init__(self, key: Optional[str] = None, timeout: Optional[float] = None, max_retries: int = 3, base_delay: float = 1.0,
+                 max_delay: float = 30.0, jitter: float = 0.5, cache_ttl: int = 86400, cache_maxsize: int = 100000) -> object:
         """Set up new 2ip.me API client.
 
         Parameters
@@ -36,6 +59,27 @@ class TwoIP(object):
         key : str, optional
             Optional API key to use for requests to the API
 
+        timeout : float, optional
+            Optional timeout (in seconds) for requests to the API
+
+        max_retries : int, default = 3
+            The number of times a request will be retried if the API is rate limited or returns a server error
+
+        base_delay : float, default = 1.0
+            The delay (in seconds) before the first retry; the delay doubles for each subsequent retry
+
+        max_delay : float, default = 30.0
+            The maximum delay (in seconds) between retries
+
+        jitter : float, default = 0.5
+            The maximum random fraction added to each retry delay
+
+        cache_ttl : int, default = 86400
+            The number of seconds lookup results are cached for
+
+        cache_maxsize : int, default = 100000
+            The maximum number of cached lookup results (the least recently used results are removed first); 0 disables caching
+
         Returns
         -------
         TwoIP : object
@@ -45,25 +89,79 @@ class TwoIP(object):
         --------
         >>> twoip = TwoIP(key = None)
         """
-        # Set API key
-        self.__key = key
-
-        # Create empty cache
-        self.__cache = {}
-        for endpoint_type in self.endpoints:
-            for type in self.endpoints[endpoint_type]:
-                self.__cache[type] = {}
-                for format in self.endpoints[endpoint_type][type]['format']:
-                    self.__cache[type][format] = {}
+        # Build the API URL paths keyed by (type, format) and the expected Content-Type headers keyed by format from the
+        # available API endpoints (the API URL itself is read for each request so it can still be changed)
+        self.__paths = {}
+        self.__content_types = {}
+        for type, endpoint in self.endpoints['ip'].items():
+            for format in endpoint['format']:
+                self.__paths[(type, format)] = f'/{type}.{format}'
+                self.__content_types[format] = f'application/{format}'
+
+        # Set the parameters added to every API request (the API key if available)
+        self.__base_params = {'key': key} if key else {}
+
+        # Set request timeout
+        self.__timeout = timeout
+
+        # Set retry policy for rate limited or failed requests
+        if min(max_retries, base_delay, max_delay, jitter) < 0:
+            raise ValueError('Retry count, delays and jitter must not be negative')
+        self.__max_retries = max_retries
+        self.__base_delay = base_delay
+        self.__max_delay = max_delay
+        self.__jitter = jitter
+
+        # Create HTTP session so connections to the API are kept alive and reused between lookups
+        self.__session = requests.Session()
+        self.__session.mount('https://', HTTPAdapter(pool_connections = 10, pool_maxsize = 20))
+
+        # Create empty cache keyed by (type, format, ip) (bounded in size and expiring entries after the TTL)
+        if cache_ttl < 0 or cache_maxsize < 0:
+            raise ValueError('Cache TTL and maximum size must not be negative')
+        self.__cache = TTLCache(maxsize = cache_maxsize, ttl = cache_ttl)
+
+        # Lookups currently being requested from the API keyed by (type, format, ip) so concurrent lookups for the same IP
+        # address share a single request (the lock also guards the cache, which is not thread safe)
+        self.__lock = threading.Lock()
+        self.__inflight = {}
 
         # Debugging
         if key:
-            logging.debug(f'Setup of new TwoIP object')
+            logger.debug('Setup of new TwoIP object')
         else:
-            logging.debug(f'Setup of new TwoIP object (No API key used - rate limits will apply)')
+            logger.debug('Setup of new TwoIP object (No API key used - rate limits will apply)')
 
-    @staticmethod
-    def __api_request(url: str, params: Optional[dict] = None) -> object:
+    def __enter__(self) -> object:
+        """Use the API client as a context manager; the HTTP session is closed on exit.
+
+        Returns
+        -------
+        TwoIP : object
+            The TwoIP API object
+
+        Examples
+        --------
+        >>> with TwoIP(key = None) as twoip:
+        ...     twoip.geo(ip = '192.0.2.0')
+        """
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close the HTTP session when leaving the context manager."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the HTTP session and release any pooled connections to the API.
+
+        Examples
+        --------
+        >>> twoip = TwoIP(key = None)
+        >>> twoip.close()
+        """
+        self.__session.close()
+
+    def __api_request(self, url: str, params: Optional[dict] = None) -> object:
         """Send request to the 2ip API and return the requests object.
 
         Parameters
@@ -84,11 +182,20 @@ class TwoIP(object):
         RuntimeError
             If the API request fails
         """
-        # Send the request
-        try:
-            req = requests.request(method = 'GET', url = url, params = params)
-        except Exception as e:
-            raise RuntimeError('API request failed') from e
+        # Send the request, retrying if the API is rate limited or has a server error
+        for attempt in range(self.__max_retries + 1):
+            try:
+                req = self.__session.get(url = url, params = params, timeout = self.__timeout)
+            except Exception as e:
+                raise RuntimeError('API request failed') from e
+
+            if attempt < self.__max_retries and self.__should_retry(status = req.status_code):
+                delay = self.__retry_delay(attempt = attempt, retry_after = req.headers.get('Retry-After'))
+                logger.debug('Received response code "%s" from API; retrying in %.2f seconds', req.status_code, delay)
+                time.sleep(delay)
+                continue
+
+            break
 
         # Make sure API request didn't result in rate limit
         if req.status_code == 429:
@@ -101,25 +208,50 @@ class TwoIP(object):
         # Return the requests object
         return req
 
-    def __api_param(self, params: dict) -> dict:
-        """Add API key to the list of parameters for the API request if available.
+    @staticmethod
+    def __should_retry(status: int) -> bool:
+        """Check if a request should be retried based on the response code.
 
         Parameters
         ----------
-        params : dict
-            The parameters to add API key to
+        status : int
+            The HTTP response code from the API
 
         Returns
         -------
-        dict
-            The built parameter list
+        bool
+            True if the API is rate limited (429) or had a server error (5xx)
         """
-        # Add API key if available
-        if self.__key:
-            params['key'] = self.__key
+        return status == 429 or status >= 500
 
-        # Return params
-        return params
+    def __retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Calculate how long to wait before retrying a request.
+
+        The Retry-After header is used if the API provided a numeric value, otherwise an exponential backoff with random
+        jitter is used. The delay is capped at the configured maximum delay.
+
+        Parameters
+        ----------
+        attempt : int
+            The number of the attempt that failed (starting at 0)
+
+        retry_after : str, optional
+            The Retry-After header from the API response
+
+        Returns
+        -------
+        float
+            The delay in seconds
+        """
+        # Honor the Retry-After header if it is a number of seconds
+        if retry_after:
+            try:
+                return min(self.__max_delay, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+
+        # Exponential backoff with jitter
+        return min(self.__max_delay, self.__base_delay * 2 ** attempt * (1 + random.random() * self.__jitter))
 
     @staticmethod
     def __test_ip(ip: str) -> bool:
@@ -135,17 +267,99 @@ class TwoIP(object):
         bool
             True if the string provided is an IP address or False if it is not an IP address
         """
-        logging.debug(f'Testing if "{ip}" is a valid IP address')
+        logger.debug('Testing if "%s" is a valid IP address', ip)
+
+        # Check if the string can be converted to a packed IPv4 or IPv6 address
+        for family in (socket.AF_INET, socket.AF_INET6):
+            try:
+                socket.inet_pton(family, ip)
+            except (OSError, TypeError, ValueError):
+                continue
+
+            # IP provided is valid
+            return True
 
-        # Check for exception when creating an ip_address object
+        logger.error('Could not validate string "%s" as an IP address', ip)
+        return False
+
+    def __api_url(self, type: str, format: str) -> str:
+        """Build the API URL for a lookup type and output format.
+
+        Parameters
+        ----------
+        type : {'geo','provider'}
+            The API type to lookup ('geo' for geographic information or 'provider' for provider information)
+
+        format : {'json', 'xml'}
+            The format for which results should be returned
+
+        Returns
+        -------
+        str
+            The API URL to send the request to
+
+        Raises
+        ------
+        ValueError
+            Invalid lookup type or output format requested
+        """
+        # Return the API URL with the prebuilt path; if there is none either the lookup type or the format is invalid
         try:
-            ip_address(ip)
-        except Exception as e:
-            logging.error(f'Could not validate string "{ip}" as an IP address: {e}')
-            return False
+            return self.api + self.__paths[(type, format)]
+        except KeyError:
+            if type not in self.endpoints['ip']:
+                raise ValueError(f'Invalid lookup type "{type}" requested') from None
+            raise ValueError(f'The "{type}" API endpoint does not support the requested format "{format}"') from None
+
+    def __parse_response(self, content: bytes, content_type: Optional[str], encoding: Optional[str], format: str) -> Union[dict, str]:
+        """Check the content type of an API response and parse the response body.
+
+        Parameters
+        ----------
+        content : bytes
+            The raw response body
 
-        # IP provided is valid
-        return True
+        content_type : str, optional
+            The Content-Type header of the response
+
+        encoding : str, optional
+            The character encoding of the response (UTF-8 will be used if not set)
+
+        format : {'json', 'xml'}
+            The format that was requested from the API - json results will be returned as a dict
+
+        Returns
+        -------
+        dict or str
+            The lookup result in either dict format (for JSON lookups) or string format (for XML lookups)
+
+        Raises
+        ------
+        RuntimeError
+            Unexpected content type or the response could not be parsed
+        """
+        # Make sure content type of the response is expected
+        expected = self.__content_types.get(format)
+        if content_type != expected:
+            if content_type:
+                raise RuntimeError(f'Expecting Content-Type header "{expected}" but got "{content_type}"')
+            else:
+                raise RuntimeError(f'API request did not provide any Content-Type header')
+
+        # If the format requests is XML, return it immediately otherwise attempt to parse the json response into a dict
+        if format == 'xml':
+            try:
+                return content.decode(encoding or 'utf-8')
+            except (UnicodeDecodeError, LookupError) as e:
+                raise RuntimeError('Exception decoding response from API') from e
+        elif format == 'json':
+            try:
+                json = json_loads(content)
+            except Exception as e:
+                raise RuntimeError('Exception parsing response from API as json') from e
+            return json
+        else:
+            raise RuntimeError(f'No output handler configured for the output format "{format}"')
 
     def __execute_ip(self, ip: str, format: str, type: str) -> Union[dict, str]:
         """Execute an API lookup for an IP address based provider (geographic information or provider information)
@@ -166,45 +380,283 @@ class TwoIP(object):
         dict or str
             The lookup result in either dict format (for JSON lookups) or string format (for XML lookups)
         """
-        # Make sure there is an endpoint for the requested type
-        if not self.endpoints['ip'][type]:
-            raise ValueError(f'Invalid lookup type "{type}" requested')
-
-        # Make sure that the format selected is valid
-        if format not in self.endpoints['ip'][type]['format']:
-            raise ValueError(f'The "{type}" API endpoint does not support the requested format "{format}"')
-
         # Build the API URL that the request will be made to
-        url = f'{self.api}/{type}.{format}'
+        url = self.__api_url(type = type, format = format)
 
-        # Set the parameters for the request (this will add the API key if available)
-        params = self.__api_param({'ip': ip})
+        # Set the parameters for the request (including the API key if available)
+        params = {'ip': ip, **self.__base_params}
 
         # Send API request
         try:
             response = self.__api_request(url = url, params = params)
         except Exception as e:
-            logging.error('Failed to send API request: {e}')
+            logger.error('Failed to send API request: %s', e)
             raise RuntimeError('Could not run API lookup') from e
 
-        # Make sure content type of the response is expected
-        if response.headers.get('Content-Type') != f'application/{format}':
-            if response.headers.get('Content-Type'):
-                raise RuntimeError(f'Expecting Content-Type header "application/{format}" but got "{req.headers.get("Content-Type")}"')
-            else:
-                raise RuntimeError(f'API request did not provide any Content-Type header')
+        # Check and parse the response
+        return self.__parse_response(content = response.content, content_type = response.headers.get('Content-Type'),
+            encoding = response.encoding, format = format)
 
-        # If the format requests is XML, return it immediately otherwise attempt to parse the json response into a dict
-        if format == 'xml':
-            return response.text
-        elif format == 'json':
+    async def __api_request_async(self, session: object, url: str, params: Optional[dict] = None) -> Tuple[bytes, Optional[str], Optional[str]]:
+        """Send request to the 2ip API with an aiohttp session and return the response body.
+
+        Parameters
+        ----------
+        session : aiohttp.ClientSession
+            The aiohttp session to send the request with
+
+        url : str
+            The URL to send request to
+
+        params : dict, Optional
+            Optional GET parameters to add to the request
+
+        Returns
+        -------
+        tuple
+            The response body, Content-Type header and character encoding
+
+        Raises
+        ------
+        RuntimeError
+            If the API request fails
+        """
+        # Send the request and read the response body, retrying if the API is rate limited or has a server error
+        for attempt in range(self.__max_retries + 1):
             try:
-                json = response.json()
+                async with session.get(url, params = params) as req:
+                    status = req.status
+                    retry_after = req.headers.get('Retry-After')
+                    content_type = req.headers.get('Content-Type')
+                    encoding = req.charset
+                    content = await req.read()
             except Exception as e:
-                raise RuntimeError('Exception parsing response from API as json') from e
-            return json
+                raise RuntimeError('API request failed') from e
+
+            if attempt < self.__max_retries and self.__should_retry(status = status):
+                delay = self.__retry_delay(attempt = attempt, retry_after = retry_after)
+                logger.debug('Received response code "%s" from API; retrying in %.2f seconds', status, delay)
+                await asyncio.sleep(delay)
+                continue
+
+            break
+
+        # Make sure API request didn't result in rate limit
+        if status == 429:
+            raise RuntimeError(f'API has reached rate limit; retry in an hour or use an API key')
+
+        # Make sure response code is fine
+        if status != 200:
+            raise RuntimeError(f'Received unexpected response code "{status}" from API')
+
+        # Return the response
+        return content, content_type, encoding
+
+    async def __execute_ip_async(self, session: object, ip: str, format: str, type: str, cache: bool) -> Union[dict, str]:
+        """Execute an API lookup for an IP address with an aiohttp session, caching the result as soon as it is available
+
+        Parameters
+        ----------
+        session : aiohttp.ClientSession
+            The aiohttp session to send the request with
+
+        ip : str
+            The IP address to lookup
+
+        format : {'json', 'xml'}
+            The format for which results should be returned - json results will be returned as a dict
+
+        type : {'geo','provider'}
+            The API type to lookup ('geo' for geographic information or 'provider' for provider information)
+
+        cache : bool
+            Allow caching of the lookup result
+
+        Returns
+        -------
+        dict or str
+            The lookup result in either dict format (for JSON lookups) or string format (for XML lookups)
+        """
+        # Build the API URL that the request will be made to
+        url = self.__api_url(type = type, format = format)
+
+        # Set the parameters for the request (including the API key if available)
+        params = {'ip': ip, **self.__base_params}
+
+        # Send API request
+        try:
+            content, content_type, encoding = await self.__api_request_async(session = session, url = url, params = params)
+        except Exception as e:
+            logger.error('Failed to send API request: %s', e)
+            raise RuntimeError('Could not run API lookup') from e
+
+        # Check and parse the response
+        response = self.__parse_response(content = content, content_type = content_type, encoding = encoding, format = format)
+
+        # Cache the response if allowed
+        if cache and self.__cache.maxsize:
+            with self.__lock:
+                self.__cache[(type, format, ip)] = response
+
+        # Return response
+        return response
+
+    async def __execute_ip_many(self, ips: Iterable[str], format: str, type: str, force: bool, cache: bool) -> Dict[str, Union[dict, str]]:
+        """Execute API lookups for multiple IP addresses concurrently
+
+        Parameters
+        ----------
+        ips : iterable of str
+            The IP addresses to lookup
+
+        format : {'json', 'xml'}
+            The format for which results should be returned - json results will be returned as a dict
+
+        type : {'geo','provider'}
+            The API type to lookup ('geo' for geographic information or 'provider' for provider information)
+
+        force : bool
+            Force requests to be sent to the API even if the lookups have already been cached
+
+        cache : bool
+            Allow caching of the lookup results
+
+        Returns
+        -------
+        dict
+            The lookup results keyed by IP address, in the order the IP addresses were provided
+        """
+        # The async lookups require aiohttp
+        if aiohttp is None:
+            raise RuntimeError('The aiohttp module is required for bulk lookups; install it with "pip install 2ip[async]"')
+
+        # Make sure the lookup type and format are valid before sending any requests
+        self.__api_url(type = type, format = format)
+
+        # A single IP address must be passed as a list (a string would otherwise be looked up character by character)
+        if isinstance(ips, (str, bytes)):
+            raise ValueError('Bulk lookups require an iterable of IP addresses, not a single string')
+
+        # Only strings can be IP addresses (checked before removing duplicates, which requires hashable values)
+        ips = list(ips)
+        for ip in ips:
+            if not isinstance(ip, str):
+                raise ValueError(f'Could not run {type} lookup for invalid IP address "{ip}"')
+
+        # Remove duplicate IP addresses (keeping the order)
+        ips = list(dict.fromkeys(ips))
+
+        logger.debug('2ip %s API bulk lookup request for %d IP addresses (force: %s)', type, len(ips), force)
+
+        # Use cached entries where available unless this is a forced lookup
+        results = {}
+        if not force:
+            with self.__lock:
+                for ip in ips:
+                    cached = self.__cache.get((type, format, ip))
+                    if cached is not None:
+                        results[ip] = cached
+        pending = [ip for ip in ips if ip not in results]
+
+        # Make sure the IP addresses that need to be looked up are valid (cached IP addresses have already been validated)
+        for ip in pending:
+            if not self.__test_ip(ip = ip):
+                raise ValueError(f'Could not run {type} lookup for invalid IP address "{ip}"')
+
+        # Run the requests for any IP addresses that were not cached
+        if pending:
+            logger.debug('Sending %d API requests (%d cached entries used)', len(pending), len(results))
+            connector = aiohttp.TCPConnector(limit = 20, ttl_dns_cache = 300)
+            timeout = aiohttp.ClientTimeout(total = self.__timeout)
+            async with aiohttp.ClientSession(connector = connector, timeout = timeout) as session:
+                responses = await asyncio.gather(*[
+                    self.__execute_ip_async(session = session, ip = ip, format = format, type = type, cache = cache) for ip in pending
+                ])
+            results.update(zip(pending, responses))
+
+        # Return the results in the order requested
+        return {ip: results[ip] for ip in ips}
+
+    def __lookup_ip(self, ip: str, format: str, type: str, force: bool, cache: bool) -> Union[dict, str]:
+        """Look up an IP address, using the cache where possible (shared by the geo and provider lookups)
+
+        Parameters
+        ----------
+        ip : str
+            The IP address to lookup
+
+        format : {'json', 'xml'}
+            The format for which results should be returned - json results will be returned as a dict
+
+        type : {'geo','provider'}
+            The API type to lookup ('geo' for geographic information or 'provider' for provider information)
+
+        force : bool
+            Force request to be sent to the API even if the lookup has already been cached
+
+        cache : bool
+            Allow caching of the request
+
+        Returns
+        -------
+        dict or str
+            The lookup result in either dict format (for JSON lookups) or string format (for XML lookups)
+        """
+        logger.debug('2ip %s API lookup request for IP "%s" (force: %s)', type, ip, force)
+
+        # Only strings can be IP addresses (checked before the cache lookup, which requires a hashable key)
+        if not isinstance(ip, str):
+            raise ValueError(f'Could not run {type} lookup for invalid IP address "{ip}"')
+        key = (type, format, ip)
+
+        # If the lookup is cached and this is not a forced lookup, return the cached result (only valid IP addresses are cached
+        # so there is no need to validate the IP address again)
+        if force:
+            logger.debug('Any cached entry will be ignored for lookup; proceeding with API request')
         else:
-            raise RuntimeError(f'No output handler configured for the output format "{format}"')
+            with self.__lock:
+                cached = self.__cache.get(key)
+            if cached is not None:
+                logger.debug('Cached API entry for IP "%s" will be returned; use the force parameter to force API request', ip)
+                return cached
+
+        # Make sure IP address provided is valid
+        if not self.__test_ip(ip = ip):
+            raise ValueError(f'Could not run {type} lookup for invalid IP address "{ip}"')
+
+        # If the same lookup is already being requested (from another thread), wait for that result instead of sending a
+        # duplicate request
+        with self.__lock:
+            future = self.__inflight.get(key)
+            pending = future is None
+            if pending:
+                future = self.__inflight[key] = Future()
+        if not pending:
+            logger.debug('Waiting for in-flight API request for IP "%s"', ip)
+            return future.result()
+
+        # Run the request and share the result (or exception) with any lookups waiting for it
+        try:
+            response = self.__execute_ip(ip = ip, format = format, type = type)
+
+            # Cache the response if allowed
+            if cache and self.__cache.maxsize:
+                with self.__lock:
+                    self.__cache[key] = response
+
+            future.set_result(response)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            # Never leave waiting lookups blocked if the request was interrupted (e.g. KeyboardInterrupt)
+            if not future.done():
+                future.set_exception(RuntimeError('In-flight API request was interrupted'))
+            with self.__lock:
+                del self.__inflight[key]
+
+        # Return response
+        return response
 
     def geo(self, ip: str, format: str = 'json', force: bool = False, cache: bool = True) -> Union[dict, str]:
         """Perform a Geographic information lookup to the 2ip API.
@@ -246,30 +698,7 @@ class TwoIP(object):
         'region': '-', 'region_rus': 'Неизвестно', 'region_ua': 'Невідомо', 'city': '-', 'city_rus': 'Неизвестно',
         'city_ua': 'Невідомо', 'zip_code': '-', 'time_zone': '-'}
         """
-        # Make sure IP address provided is valid
-        if self.__test_ip(ip = ip):
-            logging.debug(f'2ip geo API lookup request for IP "{ip}" (force: {force})')
-        else:
-            raise ValueError(f'Could not run geo lookup for invalid IP address "{ip}"')
-
-        # If the lookup is cached and this is not a forced lookup, return the cached result
-        if ip in self.__cache['geo'][format]:
-            logging.debug(f'Cached API entry available for IP "{ip}"')
-            if force:
-                logging.debug('Cached entry will be ignored for lookup; proceeding with API request')
-            else:
-                logging.debug('Cached entry will be returned; use the force parameter to force API request')
-                return self.__cache['geo'][format][ip]
-
-        # Run the request
-        response = self.__execute_ip(ip = ip, format = format, type = 'geo')
-
-        # Cache the response if allowed
-        if cache:
-            self.__cache['geo'][format][ip] = response
-
-        # Return response
-        return response
+        return self.__lookup_ip(ip = ip, format = format, type = 'geo', force = force, cache = cache)
 
     def provider(self, ip: str, format: str = 'json', force: bool = False, cache: bool = True) -> Union[dict, str]:
         """Perform a provider information lookup to the 2ip API.
@@ -310,27 +739,88 @@ class TwoIP(object):
         {'ip': '192.0.2.0', 'name_ripe': 'Reserved AS', 'name_rus': '', 'ip_range_start': '3221225984', 'ip_range_end': '3221226239',
         'route': '192.0.2.0', 'mask': '24'}
         """
-        # Make sure IP address provided is valid
-        if self.__test_ip(ip = ip):
-            logging.debug(f'2ip provider API lookup request for IP "{ip}" (force: {force})')
-        else:
-            raise ValueError(f'Could not run provider lookup for invalid IP address "{ip}"')
+        return self.__lookup_ip(ip = ip, format = format, type = 'provider', force = force, cache = cache)
 
-        # If the lookup is cached and this is not a forced lookup, return the cached result
-        if ip in self.__cache['provider'][format]:
-            logging.debug(f'Cached API entry available for IP "{ip}"')
-            if force:
-                logging.debug('Cached entry will be ignored for lookup; proceeding with API request')
-            else:
-                logging.debug('Cached entry will be returned; use the force parameter to force API request')
-                return self.__cache['provider'][format][ip]
+    async def geo_many(self, ips: Iterable[str], format: str = 'json', force: bool = False, cache: bool = True) -> Dict[str, Union[dict, str]]:
+        """Perform Geographic information lookups for multiple IP addresses concurrently (requires aiohttp).
 
-        # Run the request
-        response = self.__execute_ip(ip = ip, format = format, type = 'provider')
+        Lookups for IP addresses that have already been cached will use the cache (unless forced); the remaining lookups are
+        sent to the API concurrently over a shared connection pool.
 
-        # Cache the response if allowed
-        if cache:
-            self.__cache['provider'][format][ip] = response
+        Parameters
+        ----------
+        ips : iterable of str
+            The IP addresses to lookup
 
-        # Return response
-        return response
\ No newline at end of file
+        format : {'xml','json'}
+            The requested output format - JSON will result in a dict otherwise XML will result in a str
+
+        force : bool, default = False
+            Force requests to be sent to the API even if the lookups have already been cached
+
+        cache: bool, default = True
+            Allow caching of the requests (cache can still be bypassed by using the force parameter)
+
+        Returns
+        -------
+        dict
+            The responses from the API keyed by IP address
+
+        Raises
+        ------
+        ValueError
+            Invalid IP address, a single string instead of IP addresses or invalid output format requested
+
+        RuntimeError
+            API request failure or aiohttp is not installed
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> twoip = TwoIP(key = '12345678')
+        >>> asyncio.run(twoip.geo_many(ips = ['192.0.2.0', '192.0.2.1']))
+        {'192.0.2.0': {'ip': '192.0.2.0', 'country_code': '-', ...}, '192.0.2.1': {'ip': '192.0.2.1', 'country_code': '-', ...}}
+        """
+        return await self.__execute_ip_many(ips = ips, format = format, type = 'geo', force = force, cache = cache)
+
+    async def provider_many(self, ips: Iterable[str], format: str = 'json', force: bool = False, cache: bool = True) -> Dict[str, Union[dict, str]]:
+        """Perform provider information lookups for multiple IP addresses concurrently (requires aiohttp).
+
+        Lookups for IP addresses that have already been cached will use the cache (unless forced); the remaining lookups are
+        sent to the API concurrently over a shared connection pool.
+
+        Parameters
+        ----------
+        ips : iterable of str
+            The IP addresses to lookup
+
+        format : {'xml','json'}
+            The requested output format - JSON will result in a dict otherwise XML will result in a str
+
+        force : bool, default = False
+            Force requests to be sent to the API even if the lookups have already been cached
+
+        cache: bool, default = True
+            Allow caching of the requests (cache can still be bypassed by using the force parameter)
+
+        Returns
+        -------
+        dict
+            The responses from the API keyed by IP address
+
+        Raises
+        ------
+        ValueError
+            Invalid IP address, a single string instead of IP addresses or invalid output format requested
+
+        RuntimeError
+            API request failure or aiohttp is not installed
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> twoip = TwoIP(key = '12345678')
+        >>> asyncio.run(twoip.provider_many(ips = ['192.0.2.0', '192.0.2.1']))
+        {'192.0.2.0': {'ip': '192.0.2.0', 'name_ripe': 'Reserved AS', ...}, '192.0.2.1': {'ip': '192.0.2.1', 'name_ripe': 'Reserved AS', ...}}
+        """
+        return await self.__execute_ip_many(ips = ips, format = format, type = 'provider', force = force, cache = cache)